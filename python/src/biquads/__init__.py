@@ -1,6 +1,7 @@
 from .filters import (
     AllPassFilter,
     BandPassFilter,
+    CoefficientBank,
     DigitalBiquadFilter,
     HighPassFilter,
     HighShelfFilter,
@@ -13,6 +14,7 @@ from .filters import (
 __all__ = [
     'AllPassFilter',
     'BandPassFilter',
+    'CoefficientBank',
     'DigitalBiquadFilter',
     'HighPassFilter',
     'HighShelfFilter',
@@ -1,6 +1,6 @@
 from .all_pass import AllPassFilter
 from .band_pass import BandPassFilter
-from .biquad import DigitalBiquadFilter
+from .biquad import CoefficientBank, DigitalBiquadFilter
 from .high_pass import HighPassFilter
 from .high_shelf import HighShelfFilter
 from .low_pass import LowPassFilter
@@ -11,6 +11,7 @@ from .peaking_eq import PeakingEQFilter
 __all__ = [
     'AllPassFilter',
     'BandPassFilter',
+    'CoefficientBank',
     'DigitalBiquadFilter',
     'HighPassFilter',
     'HighShelfFilter',
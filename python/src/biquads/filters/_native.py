@@ -0,0 +1,103 @@
+# _native.py
+
+"""
+Copyright © 2025 Alex Parisi
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Optional natively-compiled coefficient kernels. When numba is installed,
+the shelf/peaking coefficient math is compiled to machine code, bypassing
+the interpreter for the per-call arithmetic; otherwise the exported names
+are None and callers fall back to the pure-Python kernels.
+"""
+
+import math
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional dependency
+    njit = None
+
+_TWO_PI = 2.0 * math.pi
+_LOG2_10_OVER_40 = math.log2(10.0) / 40.0
+
+# Compiling eagerly against an explicit signature moves the compile cost to
+# import time, and cache=True persists the machine code on disk so every run
+# after the first loads it with no JIT warm-up (numba's supported successor
+# to the removed numba.pycc AOT compiler).
+_SIGNATURE = "UniTuple(float64, 6)(float64, float64, float64, float64)"
+
+if njit is not None:
+    @njit(_SIGNATURE, cache=True)
+    def lowshelf(cutoff: float, inv_sample_rate: float, inv_2q: float,
+                 gain: float) -> tuple:
+        """
+        Compiled low shelf coefficient kernel.
+
+        :param cutoff: The center frequency.
+        :param inv_sample_rate: The reciprocal of the sample rate.
+        :param inv_2q: The reciprocal of twice the Q factor.
+        :param gain: The gain.
+        :return: The (b0, b1, b2, a0, a1, a2) tuple.
+        """
+        w0 = _TWO_PI * cutoff * inv_sample_rate
+        cos_w0 = math.cos(w0)
+        alpha = math.sin(w0) * inv_2q
+        a = 2.0 ** (gain * _LOG2_10_OVER_40)
+        a_p1 = a + 1.0
+        a_m1 = a - 1.0
+        a_m1_cos = a_m1 * cos_w0
+        a_p1_cos = a_p1 * cos_w0
+        two_sqrt_a_alpha = 2.0 * math.sqrt(a) * alpha
+        b0 = a * (a_p1 - a_m1_cos + two_sqrt_a_alpha)
+        b1 = 2.0 * a * (a_m1 - a_p1_cos)
+        b2 = a * (a_p1 - a_m1_cos - two_sqrt_a_alpha)
+        a0 = a_p1 + a_m1_cos + two_sqrt_a_alpha
+        a1 = -2.0 * (a_m1 + a_p1_cos)
+        a2 = a_p1 + a_m1_cos - two_sqrt_a_alpha
+        return b0, b1, b2, a0, a1, a2
+
+    @njit(_SIGNATURE, cache=True)
+    def peaking(cutoff: float, inv_sample_rate: float, inv_2q: float,
+                gain: float) -> tuple:
+        """
+        Compiled peaking EQ coefficient kernel.
+
+        :param cutoff: The center frequency.
+        :param inv_sample_rate: The reciprocal of the sample rate.
+        :param inv_2q: The reciprocal of twice the Q factor.
+        :param gain: The gain.
+        :return: The (b0, b1, b2, a0, a1, a2) tuple.
+        """
+        w0 = _TWO_PI * cutoff * inv_sample_rate
+        cos_w0 = math.cos(w0)
+        alpha = math.sin(w0) * inv_2q
+        neg_2_cos = -2.0 * cos_w0
+        if gain == 0.0:
+            return (1.0 + alpha, neg_2_cos, 1.0 - alpha,
+                    1.0 + alpha, neg_2_cos, 1.0 - alpha)
+        a = 2.0 ** (gain * _LOG2_10_OVER_40)
+        inv_a = 1.0 / a
+        alpha_a = alpha * a
+        alpha_over_a = alpha * inv_a
+        return (1.0 + alpha_a, neg_2_cos, 1.0 - alpha_a,
+                1.0 + alpha_over_a, neg_2_cos, 1.0 - alpha_over_a)
+else:
+    lowshelf = None
+    peaking = None
@@ -0,0 +1,157 @@
+# _preamble.py
+
+"""
+Copyright © 2025 Alex Parisi
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Shared scalar coefficient pipeline for the gain-based filters. Every
+biquad formula in this package starts from the same (sin w0, cos w0,
+alpha, A) preamble and differs only in the six closing expressions, so the
+preamble is computed once here and the per-filter-type formulas are looked
+up in a table.
+"""
+
+import functools
+import math
+
+from src.biquads.filters._trig import sincos_w0, sincos_w0_for
+
+_LOG2_10_OVER_40 = math.log2(10.0) / 40.0
+
+
+def preamble(cutoff: float, inv_sample_rate: float, inv_2q: float,
+             gain: float, _sincos_w0=sincos_w0,
+             _kg=_LOG2_10_OVER_40) -> tuple:
+    """
+    Compute the quantities shared by every coefficient formula. The
+    trailing defaults bind hot globals as locals.
+
+    :param cutoff: The center frequency.
+    :param inv_sample_rate: The reciprocal of the sample rate.
+    :param inv_2q: The reciprocal of twice the Q factor.
+    :param gain: The gain.
+    :return: The (sin(w0), cos(w0), alpha, A) tuple.
+    """
+    sin_w0, cos_w0 = _sincos_w0(cutoff, inv_sample_rate)
+    a = 1.0 if gain == 0.0 else 2.0 ** (gain * _kg)
+    return sin_w0, cos_w0, sin_w0 * inv_2q, a
+
+
+def _low_shelf(sin_w0: float, cos_w0: float, alpha: float, a: float,
+               _sqrt=math.sqrt) -> tuple:
+    """
+    Closing expressions for the low shelf filter.
+
+    :param sin_w0: The sine of w0.
+    :param cos_w0: The cosine of w0.
+    :param alpha: The alpha parameter.
+    :param a: The A (gain) parameter.
+    :return: The (b0, b1, b2, a0, a1, a2) tuple.
+    """
+    a_p1 = a + 1.0
+    a_m1 = a - 1.0
+    a_m1_cos = a_m1 * cos_w0
+    a_p1_cos = a_p1 * cos_w0
+    two_sqrt_a_alpha = 2.0 * _sqrt(a) * alpha
+    return (a * (a_p1 - a_m1_cos + two_sqrt_a_alpha),
+            2.0 * a * (a_m1 - a_p1_cos),
+            a * (a_p1 - a_m1_cos - two_sqrt_a_alpha),
+            a_p1 + a_m1_cos + two_sqrt_a_alpha,
+            -2.0 * (a_m1 + a_p1_cos),
+            a_p1 + a_m1_cos - two_sqrt_a_alpha)
+
+
+def _peaking_eq(sin_w0: float, cos_w0: float, alpha: float, a: float) -> tuple:
+    """
+    Closing expressions for the peaking EQ filter.
+
+    :param sin_w0: The sine of w0.
+    :param cos_w0: The cosine of w0.
+    :param alpha: The alpha parameter.
+    :param a: The A (gain) parameter.
+    :return: The (b0, b1, b2, a0, a1, a2) tuple.
+    """
+    neg_2_cos = -2.0 * cos_w0
+    if a == 1.0:
+        # Zero gain: numerator and denominator coincide.
+        return 1.0 + alpha, neg_2_cos, 1.0 - alpha, 1.0 + alpha, neg_2_cos, 1.0 - alpha
+    inv_a = 1.0 / a
+    alpha_a = alpha * a
+    alpha_over_a = alpha * inv_a
+    return (1.0 + alpha_a, neg_2_cos, 1.0 - alpha_a,
+            1.0 + alpha_over_a, neg_2_cos, 1.0 - alpha_over_a)
+
+
+FORMULAS = {
+    'low_shelf': _low_shelf,
+    'peaking_eq': _peaking_eq,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def specialize(filter_type: str, inv_sample_rate: float):
+    """
+    Build a coefficient function specialized for one filter type and
+    sample rate. The formula lookup and the sample-rate-dependent trig
+    constants are resolved once when the closure is generated, so the
+    returned function only takes the parameters that actually vary in
+    sweeps. Deployed audio code uses one or two sample rates for the
+    program lifetime, so the specializations are cached.
+
+    :param filter_type: The filter type key in FORMULAS.
+    :param inv_sample_rate: The reciprocal of the sample rate.
+    :return: A function mapping (cutoff, inv_2q, gain) to coefficients.
+    """
+    formula = FORMULAS[filter_type]
+    lookup = sincos_w0_for(inv_sample_rate)
+
+    def calculate(cutoff: float, inv_2q: float, gain: float,
+                  _lookup=lookup, _formula=formula,
+                  _kg=_LOG2_10_OVER_40) -> tuple:
+        """
+        Calculate coefficients for this closure's filter type and
+        sample rate.
+
+        :param cutoff: The center frequency.
+        :param inv_2q: The reciprocal of twice the Q factor.
+        :param gain: The gain.
+        :return: The (b0, b1, b2, a0, a1, a2) tuple.
+        """
+        sin_w0, cos_w0 = _lookup(cutoff)
+        a = 1.0 if gain == 0.0 else 2.0 ** (gain * _kg)
+        return _formula(sin_w0, cos_w0, sin_w0 * inv_2q, a)
+
+    return calculate
+
+
+def compute(filter_type: str, cutoff: float, inv_sample_rate: float,
+            inv_2q: float, gain: float) -> tuple:
+    """
+    Calculate the coefficients for the given filter type by dispatching
+    to the specialized function for its sample rate.
+
+    :param filter_type: The filter type key in FORMULAS.
+    :param cutoff: The center frequency.
+    :param inv_sample_rate: The reciprocal of the sample rate.
+    :param inv_2q: The reciprocal of twice the Q factor.
+    :param gain: The gain.
+    :return: The (b0, b1, b2, a0, a1, a2) tuple.
+    """
+    return specialize(filter_type, inv_sample_rate)(cutoff, inv_2q, gain)
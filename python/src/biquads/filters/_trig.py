@@ -0,0 +1,136 @@
+# _trig.py
+
+"""
+Copyright © 2025 Alex Parisi
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import functools
+import math
+
+import numpy as np
+
+try:
+    import ctypes
+
+    _libm = ctypes.CDLL("libm.so.6")
+    _libm.sincos.argtypes = [ctypes.c_double, ctypes.POINTER(ctypes.c_double),
+                             ctypes.POINTER(ctypes.c_double)]
+    _libm.sincos.restype = None
+
+    def sincos(w: float) -> tuple:
+        """
+        Compute sin(w) and cos(w) with a single fused libm sincos call,
+        sharing the argument reduction between the two results.
+
+        :param w: The angle in radians.
+        :return: The (sin(w), cos(w)) tuple.
+        """
+        s = ctypes.c_double()
+        c = ctypes.c_double()
+        _libm.sincos(w, ctypes.byref(s), ctypes.byref(c))
+        return s.value, c.value
+
+    if sincos(0.0) != (0.0, 1.0):
+        raise OSError("libm sincos returned unexpected values")
+except (OSError, AttributeError):
+    def sincos(w: float) -> tuple:
+        """
+        Compute sin(w) and cos(w) with separate math module calls; fallback
+        for platforms without an accessible libm sincos.
+
+        :param w: The angle in radians.
+        :return: The (sin(w), cos(w)) tuple.
+        """
+        return math.sin(w), math.cos(w)
+
+
+_TWO_PI = 2.0 * math.pi
+
+# For any valid filter, w0 = 2*pi*cutoff/sample_rate lies in [0, pi), so a
+# single table over that interval serves every sample rate. Stored as plain
+# lists because scalar indexing of a list is cheaper than of an ndarray.
+_LUT_BINS = 16384
+# w0 * BINS/pi simplifies to cutoff * inv_sample_rate * 2 * BINS.
+_POS_SCALE = 2.0 * _LUT_BINS
+_SIN_LUT = np.sin(np.linspace(0.0, math.pi, _LUT_BINS + 1)).tolist()
+_COS_LUT = np.cos(np.linspace(0.0, math.pi, _LUT_BINS + 1)).tolist()
+
+
+def sincos_w0(cutoff: float, inv_sample_rate: float,
+              _pos_scale=_POS_SCALE, _bins=_LUT_BINS,
+              _sin_lut=_SIN_LUT, _cos_lut=_COS_LUT) -> tuple:
+    """
+    Look up sin(w0) and cos(w0) for w0 = 2*pi*cutoff/sample_rate by linear
+    interpolation in a precomputed table, replacing two transcendental
+    calls with two loads and a FMA per value. Falls back to an exact
+    sincos for angles outside the table (invalid cutoff/sample rate
+    combinations). The trailing defaults bind the table as locals to skip
+    the global lookups per call.
+
+    :param cutoff: The cutoff frequency.
+    :param inv_sample_rate: The reciprocal of the sample rate.
+    :return: The (sin(w0), cos(w0)) tuple.
+    """
+    pos = cutoff * inv_sample_rate * _pos_scale
+    idx = int(pos)
+    if 0 <= idx < _bins:
+        frac = pos - idx
+        sin_lo = _sin_lut[idx]
+        cos_lo = _cos_lut[idx]
+        return (sin_lo + (_sin_lut[idx + 1] - sin_lo) * frac,
+                cos_lo + (_cos_lut[idx + 1] - cos_lo) * frac)
+    return sincos(_TWO_PI * cutoff * inv_sample_rate)
+
+
+@functools.lru_cache(maxsize=32)
+def sincos_w0_for(inv_sample_rate: float):
+    """
+    Build a sin/cos lookup specialized for one sample rate. The table
+    index scale and the fallback angle factor are folded into per-closure
+    constants, so each call is one multiply, the bounds check and the
+    interpolation. In practice a program uses a handful of sample rates,
+    so the specialized closures are cached.
+
+    :param inv_sample_rate: The reciprocal of the sample rate.
+    :return: A function mapping cutoff to the (sin(w0), cos(w0)) tuple.
+    """
+    pos_k = inv_sample_rate * _POS_SCALE
+    w_k = _TWO_PI * inv_sample_rate
+
+    def lookup(cutoff: float, _pos_k=pos_k, _w_k=w_k, _bins=_LUT_BINS,
+               _sin_lut=_SIN_LUT, _cos_lut=_COS_LUT) -> tuple:
+        """
+        Look up sin(w0) and cos(w0) for this closure's sample rate.
+
+        :param cutoff: The cutoff frequency.
+        :return: The (sin(w0), cos(w0)) tuple.
+        """
+        pos = cutoff * _pos_k
+        idx = int(pos)
+        if 0 <= idx < _bins:
+            frac = pos - idx
+            sin_lo = _sin_lut[idx]
+            cos_lo = _cos_lut[idx]
+            return (sin_lo + (_sin_lut[idx + 1] - sin_lo) * frac,
+                    cos_lo + (_cos_lut[idx + 1] - cos_lo) * frac)
+        return sincos(cutoff * _w_k)
+
+    return lookup
@@ -29,7 +29,7 @@ import numpy as np
 T = TypeVar("T", float, np.floating)
 
 
-@dataclass
+@dataclass(slots=True)
 class Coefficients(Generic[T]):
     """
     Coefficients for a digital biquad filter.
@@ -48,6 +48,133 @@ class Coefficients(Generic[T]):
     a1: T
     a2: T
 
+    def astype(self, dtype) -> 'Coefficients':
+        """
+        Convert the coefficients to the given floating-point type; e.g.
+        np.float32 halves coefficient memory traffic for audio-rate
+        processing at the cost of precision.
+
+        :param dtype: The target type, e.g. np.float32.
+        :return: A new Coefficients with converted values.
+        """
+        return Coefficients(dtype(self.b0), dtype(self.b1), dtype(self.b2),
+                            dtype(self.a0), dtype(self.a1), dtype(self.a2))
+
+    def as_array(self, dtype=np.float64) -> np.ndarray:
+        """
+        Pack the coefficients into a (6,) array in (b0, b1, b2, a0, a1, a2)
+        order.
+
+        :param dtype: The array dtype.
+        :return: The coefficient array.
+        """
+        return np.array([self.b0, self.b1, self.b2, self.a0, self.a1, self.a2],
+                        dtype=dtype)
+
+
+@dataclass
+class CoefficientBank:
+    """
+    Struct-of-arrays container for the coefficients of a bank of biquad
+    filters. Each field holds one coefficient for all filters in a
+    contiguous array, which keeps bulk recomputation cache-friendly and
+    lets NumPy vectorize across the bank.
+
+    :param b0: Numerator coefficients b0 for all filters.
+    :param b1: Numerator coefficients b1 for all filters.
+    :param b2: Numerator coefficients b2 for all filters.
+    :param a0: Denominator coefficients a0 for all filters.
+    :param a1: Denominator coefficients a1 for all filters.
+    :param a2: Denominator coefficients a2 for all filters.
+    """
+    b0: np.ndarray
+    b1: np.ndarray
+    b2: np.ndarray
+    a0: np.ndarray
+    a1: np.ndarray
+    a2: np.ndarray
+
+    def __len__(self) -> int:
+        """
+        Get the number of filters in the bank.
+        :return: The number of filters.
+        """
+        return len(self.b0)
+
+    @staticmethod
+    def from_array(coefficients: np.ndarray) -> 'CoefficientBank':
+        """
+        Create a coefficient bank from an (N, 6) coefficient array, as
+        returned by the calculate_coefficients_batch methods.
+
+        :param coefficients: The (N, 6) array of (b0, b1, b2, a0, a1, a2) rows.
+        :return: The coefficient bank.
+        """
+        columns = np.ascontiguousarray(coefficients).T
+        return CoefficientBank(np.ascontiguousarray(columns[0]),
+                               np.ascontiguousarray(columns[1]),
+                               np.ascontiguousarray(columns[2]),
+                               np.ascontiguousarray(columns[3]),
+                               np.ascontiguousarray(columns[4]),
+                               np.ascontiguousarray(columns[5]))
+
+    @staticmethod
+    def from_low_shelf(cutoffs: np.ndarray, sample_rates: np.ndarray,
+                       q_factors: np.ndarray, gains: np.ndarray) -> 'CoefficientBank':
+        """
+        Create a coefficient bank for a bank of low shelf filters.
+
+        :param cutoffs: The center frequencies.
+        :param sample_rates: The sample rates.
+        :param q_factors: The Q factors.
+        :param gains: The gains.
+        :return: The coefficient bank.
+        """
+        from src.biquads.filters.low_shelf import LowShelfFilter
+        return CoefficientBank.from_array(
+            LowShelfFilter.calculate_coefficients_batch(cutoffs, sample_rates,
+                                                        q_factors, gains))
+
+    @staticmethod
+    def from_peaking_eq(cutoffs: np.ndarray, sample_rates: np.ndarray,
+                        q_factors: np.ndarray, gains: np.ndarray) -> 'CoefficientBank':
+        """
+        Create a coefficient bank for a bank of peaking EQ filters.
+
+        :param cutoffs: The center frequencies.
+        :param sample_rates: The sample rates.
+        :param q_factors: The Q factors.
+        :param gains: The gains.
+        :return: The coefficient bank.
+        """
+        from src.biquads.filters.peaking_eq import PeakingEQFilter
+        return CoefficientBank.from_array(
+            PeakingEQFilter.calculate_coefficients_batch(cutoffs, sample_rates,
+                                                         q_factors, gains))
+
+    def astype(self, dtype) -> 'CoefficientBank':
+        """
+        Convert the bank's coefficient arrays to the given dtype; e.g.
+        np.float32 halves the bank's memory footprint and bandwidth.
+
+        :param dtype: The target dtype, e.g. np.float32.
+        :return: A new CoefficientBank with converted arrays.
+        """
+        return CoefficientBank(self.b0.astype(dtype), self.b1.astype(dtype),
+                               self.b2.astype(dtype), self.a0.astype(dtype),
+                               self.a1.astype(dtype), self.a2.astype(dtype))
+
+    def to_coefficients_list(self) -> list:
+        """
+        Convert the bank to a list of per-filter Coefficients objects for
+        callers that consume one filter at a time.
+
+        :return: The list of Coefficients.
+        """
+        return [Coefficients(float(self.b0[i]), float(self.b1[i]), float(self.b2[i]),
+                             float(self.a0[i]), float(self.a1[i]), float(self.a2[i]))
+                for i in range(len(self))]
+
 
 @dataclass
 class State(Generic[T]):
@@ -33,6 +33,9 @@ class FilterObject:
     Base class for a filter object.
     """
 
+    __slots__ = ('m_filter', 'm_cutoff', 'm_sampleRate', 'm_qFactor', 'm_gain',
+                 'm_constantSkirtGain', 'm_bypass', '_inv_sr', '_inv_2q')
+
     def __init__(self):
         """
         Initialize the filter object.
@@ -44,6 +47,8 @@ class FilterObject:
         self.m_gain: float = 0.0
         self.m_constantSkirtGain: bool = False
         self.m_bypass: bool = False
+        self._inv_sr: float = 0.0
+        self._inv_2q: float = 0.0
 
     def process(self, sample: float) -> float:
         """
@@ -97,6 +102,7 @@ class FilterObject:
         if sample_rate <= 0:
             return False
         self.m_sampleRate = sample_rate
+        self._inv_sr = 1.0 / sample_rate
         return self._update_coefficients()
 
     def get_sample_rate(self) -> int:
@@ -117,6 +123,7 @@ class FilterObject:
         if q_factor <= 0.0:
             return False
         self.m_qFactor = q_factor
+        self._inv_2q = 0.5 / q_factor
         return self._update_coefficients()
 
     def get_q_factor(self) -> float:
@@ -174,4 +181,7 @@ class FilterObject:
         :param q: The Q factor.
         :return: True if the parameters are valid, False otherwise.
         """
-        return 0.0 < cutoff < (sample_rate / 2) and sample_rate > 0 and q > 0.0
+        # Bitwise & on the bool operands evaluates all comparisons in one
+        # pass with no conditional jumps between them.
+        return bool((cutoff > 0.0) & (sample_rate > 0) & (q > 0.0)
+                    & (cutoff < 0.5 * sample_rate))
@@ -21,11 +21,41 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import functools
 import math
 from typing import Optional
 
+import numpy as np
+
 from src.biquads.filters.biquad import DigitalBiquadFilter, Coefficients
 from src.biquads.filters.filter import FilterObject
+from src.biquads.filters import _native
+from src.biquads.filters import _preamble
+
+_TWO_PI = 2.0 * math.pi
+# 10 ** (gain / 40) == 2 ** (gain * log2(10) / 40); the base-2 form avoids
+# the general pow(10, x) libm path.
+_LOG2_10_OVER_40 = math.log2(10.0) / 40.0
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_coefficients(cutoff: float, inv_sample_rate: float, inv_2q: float,
+                         gain: float) -> tuple:
+    """
+    Calculate low shelf coefficients for one parameter set, memoized.
+
+    Returns a plain tuple rather than a Coefficients object because
+    DigitalBiquadFilter normalizes coefficients in place; each caller
+    gets a fresh Coefficients built from the cached values.
+    :param cutoff: The center frequency.
+    :param inv_sample_rate: The reciprocal of the sample rate.
+    :param inv_2q: The reciprocal of twice the Q factor.
+    :param gain: The gain.
+    :return: The (b0, b1, b2, a0, a1, a2) tuple.
+    """
+    if _native.lowshelf is not None:
+        return _native.lowshelf(cutoff, inv_sample_rate, inv_2q, gain)
+    return _preamble.compute('low_shelf', cutoff, inv_sample_rate, inv_2q, gain)
 
 
 class LowShelfFilter(FilterObject):
@@ -33,6 +63,8 @@ class LowShelfFilter(FilterObject):
     Low shelf filter object.
     """
 
+    __slots__ = ()
+
     def __init__(self, cutoff: float, sample_rate: int, q_factor: float = 1.0 / math.sqrt(2.0),
                  gain: float = 0.0):
         """
@@ -45,13 +77,15 @@ class LowShelfFilter(FilterObject):
         super().__init__()
         self.m_cutoff = cutoff
         self.m_sampleRate = sample_rate
+        self._inv_sr = 1.0 / sample_rate if sample_rate else 0.0
         self.m_qFactor = q_factor
+        self._inv_2q = 0.5 / q_factor if q_factor else 0.0
         self.m_gain = gain
         coefficients = self.calculate_coefficients()
         self.m_filter = DigitalBiquadFilter.create(coefficients)
 
-    @staticmethod
-    def create(cutoff: float, sample_rate: int, q_factor: float = 1.0 / math.sqrt(2.0),
+    @classmethod
+    def create(cls, cutoff: float, sample_rate: int, q_factor: float = 1.0 / math.sqrt(2.0),
                gain: float = 0.0) -> Optional['LowShelfFilter']:
         """
         Create a low shelf filter object.
@@ -61,26 +95,54 @@ class LowShelfFilter(FilterObject):
         :param gain: The gain.
         :return: The low shelf filter object.
         """
-        if not FilterObject.verify_parameters(cutoff, sample_rate, q_factor):
-            return None
-        f = LowShelfFilter(cutoff, sample_rate, q_factor, gain)
-        if not f.m_filter:
-            return None
-        return f
+        return (cls(cutoff, sample_rate, q_factor, gain)
+                if FilterObject.verify_parameters(cutoff, sample_rate, q_factor)
+                else None)
 
     def calculate_coefficients(self) -> Coefficients:
         """
         Calculate the filter coefficients.
         :return: The filter coefficients.
         """
-        w0 = 2.0 * math.pi * self.m_cutoff / self.m_sampleRate
-        cos_w0 = math.cos(w0)
-        alpha = math.sin(w0) / (2.0 * self.m_qFactor)
-        a = math.pow(10.0, self.m_gain / 40.0)
-        b0 = a * ((a + 1.0) - (a - 1.0) * cos_w0 + 2.0 * math.sqrt(a) * alpha)
-        b1 = 2.0 * a * ((a - 1.0) - (a + 1.0) * cos_w0)
-        b2 = a * ((a + 1.0) - (a - 1.0) * cos_w0 - 2.0 * math.sqrt(a) * alpha)
-        a0 = (a + 1.0) + (a - 1.0) * cos_w0 + 2.0 * math.sqrt(a) * alpha
-        a1 = -2.0 * ((a - 1.0) + (a + 1.0) * cos_w0)
-        a2 = (a + 1.0) + (a - 1.0) * cos_w0 - 2.0 * math.sqrt(a) * alpha
-        return Coefficients(b0, b1, b2, a0, a1, a2)
+        return Coefficients(*_cached_coefficients(self.m_cutoff, self._inv_sr,
+                                                  self._inv_2q, self.m_gain))
+
+    @staticmethod
+    def calculate_coefficients_batch(cutoffs: np.ndarray, sample_rates: np.ndarray,
+                                     q_factors: np.ndarray, gains: np.ndarray) -> np.ndarray:
+        """
+        Calculate the filter coefficients for a batch of low shelf filters.
+
+        All parameters are broadcast against each other, so a scalar sample
+        rate can be combined with an array of cutoff frequencies.
+        :param cutoffs: The center frequencies.
+        :param sample_rates: The sample rates.
+        :param q_factors: The Q factors.
+        :param gains: The gains.
+        :return: An (N, 6) array of (b0, b1, b2, a0, a1, a2) rows.
+        """
+        cutoffs = np.asarray(cutoffs, dtype=np.float64)
+        sample_rates = np.asarray(sample_rates, dtype=np.float64)
+        q_factors = np.asarray(q_factors, dtype=np.float64)
+        gains = np.asarray(gains, dtype=np.float64)
+        out = np.empty(np.broadcast_shapes(cutoffs.shape, sample_rates.shape,
+                                           q_factors.shape, gains.shape) + (6,))
+        # NumPy's sin/cos ufuncs dispatch to SIMD loops, so one pass over w0
+        # covers the whole bank; w0's buffer is then reused for cos_w0.
+        w0 = _TWO_PI * cutoffs / sample_rates
+        sin_w0 = np.sin(w0)
+        cos_w0 = np.cos(w0, out=w0) if w0.ndim else np.cos(w0)
+        alpha = sin_w0 / (2.0 * q_factors)
+        a = np.exp2(gains * _LOG2_10_OVER_40)
+        a_p1 = a + 1.0
+        a_m1 = a - 1.0
+        a_m1_cos = a_m1 * cos_w0
+        a_p1_cos = a_p1 * cos_w0
+        two_sqrt_a_alpha = 2.0 * np.sqrt(a) * alpha
+        out[..., 0] = a * (a_p1 - a_m1_cos + two_sqrt_a_alpha)
+        out[..., 1] = 2.0 * a * (a_m1 - a_p1_cos)
+        out[..., 2] = a * (a_p1 - a_m1_cos - two_sqrt_a_alpha)
+        out[..., 3] = a_p1 + a_m1_cos + two_sqrt_a_alpha
+        out[..., 4] = -2.0 * (a_m1 + a_p1_cos)
+        out[..., 5] = a_p1 + a_m1_cos - two_sqrt_a_alpha
+        return out
@@ -0,0 +1,95 @@
+# gpu.py
+
+"""
+Copyright © 2025 Alex Parisi
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+GPU coefficient calculation for very large filter banks via CuPy. This
+module is only worth importing for bulk workloads (roughly ten thousand
+filters or more); below that, the NumPy batch paths on the filter classes
+are faster once device transfer is accounted for. CuPy is an optional
+dependency and is only required if this module is imported.
+"""
+
+import math
+
+try:
+    import cupy as cp
+except ImportError as exc:  # cupy is an optional dependency
+    raise ImportError(
+        "biquads.gpu requires cupy; install it to compute coefficients on "
+        "the GPU") from exc
+
+_TWO_PI = 2.0 * math.pi
+_LOG2_10_OVER_40 = math.log2(10.0) / 40.0
+
+
+def low_shelf_coefficients_gpu(cutoffs, sample_rates, q_factors, gains):
+    """
+    Calculate low shelf coefficients for a bank of filters on the GPU.
+
+    All parameters are device arrays (or scalars) broadcast against each
+    other.
+    :param cutoffs: The center frequencies.
+    :param sample_rates: The sample rates.
+    :param q_factors: The Q factors.
+    :param gains: The gains.
+    :return: A device (N, 6) array of (b0, b1, b2, a0, a1, a2) rows.
+    """
+    w0 = _TWO_PI * cp.asarray(cutoffs) / cp.asarray(sample_rates)
+    cos_w0 = cp.cos(w0)
+    alpha = cp.sin(w0) / (2.0 * cp.asarray(q_factors))
+    a = cp.exp2(cp.asarray(gains) * _LOG2_10_OVER_40)
+    a_p1 = a + 1.0
+    a_m1 = a - 1.0
+    a_m1_cos = a_m1 * cos_w0
+    a_p1_cos = a_p1 * cos_w0
+    two_sqrt_a_alpha = 2.0 * cp.sqrt(a) * alpha
+    return cp.stack(cp.broadcast_arrays(
+        a * (a_p1 - a_m1_cos + two_sqrt_a_alpha),
+        2.0 * a * (a_m1 - a_p1_cos),
+        a * (a_p1 - a_m1_cos - two_sqrt_a_alpha),
+        a_p1 + a_m1_cos + two_sqrt_a_alpha,
+        -2.0 * (a_m1 + a_p1_cos),
+        a_p1 + a_m1_cos - two_sqrt_a_alpha), axis=-1)
+
+
+def peaking_eq_coefficients_gpu(cutoffs, sample_rates, q_factors, gains):
+    """
+    Calculate peaking EQ coefficients for a bank of filters on the GPU.
+
+    All parameters are device arrays (or scalars) broadcast against each
+    other.
+    :param cutoffs: The center frequencies.
+    :param sample_rates: The sample rates.
+    :param q_factors: The Q factors.
+    :param gains: The gains.
+    :return: A device (N, 6) array of (b0, b1, b2, a0, a1, a2) rows.
+    """
+    w0 = _TWO_PI * cp.asarray(cutoffs) / cp.asarray(sample_rates)
+    cos_w0 = cp.cos(w0)
+    alpha = cp.sin(w0) / (2.0 * cp.asarray(q_factors))
+    a = cp.exp2(cp.asarray(gains) * _LOG2_10_OVER_40)
+    alpha_a = alpha * a
+    alpha_over_a = alpha / a
+    neg_2_cos = -2.0 * cos_w0
+    return cp.stack(cp.broadcast_arrays(
+        1.0 + alpha_a, neg_2_cos, 1.0 - alpha_a,
+        1.0 + alpha_over_a, neg_2_cos, 1.0 - alpha_over_a), axis=-1)
@@ -25,7 +25,7 @@ SOFTWARE.
 import unittest
 import numpy as np
 
-from src.biquads.filters.biquad import Coefficients, DigitalBiquadFilter
+from src.biquads.filters.biquad import CoefficientBank, Coefficients, DigitalBiquadFilter
 
 
 class TestDigitalBiquadFilter(unittest.TestCase):
@@ -157,5 +157,86 @@ class TestDigitalBiquadFilter(unittest.TestCase):
         self.assertAlmostEqual(dbf.process(sample), -1.0)
 
 
+class TestCoefficientsPrecision(unittest.TestCase):
+    """
+    Test the precision conversion helpers on Coefficients.
+    """
+
+    def test_astype_float32(self):
+        """
+        Test the conversion of coefficients to single precision.
+        """
+        coefficients = Coefficients(1.0, 0.5, 0.25, 1.0, 0.0, 0.0)
+        converted = coefficients.astype(np.float32)
+        self.assertIsInstance(converted.b0, np.float32)
+        self.assertAlmostEqual(float(converted.b1), 0.5)
+
+    def test_as_array(self):
+        """
+        Test the packing of coefficients into an array.
+        """
+        coefficients = Coefficients(1.0, 0.5, 0.25, 1.0, 0.0, 0.0)
+        arr = coefficients.as_array(dtype=np.float32)
+        self.assertEqual(arr.dtype, np.float32)
+        np.testing.assert_array_almost_equal(arr, [1.0, 0.5, 0.25, 1.0, 0.0, 0.0])
+
+    def test_process_with_float32_coefficients(self):
+        """
+        Test the processing of samples with single-precision coefficients.
+        """
+        coefficients = Coefficients(1.0, 0.0, 0.0, 1.0, 0.0, 0.0).astype(np.float32)
+        dbf = DigitalBiquadFilter.create(coefficients)
+        self.assertIsNotNone(dbf)
+        self.assertAlmostEqual(dbf.process(np.float32(0.5)), 0.5)
+
+
+class TestCoefficientBank(unittest.TestCase):
+    """
+    Test the CoefficientBank class.
+    """
+
+    def test_from_low_shelf(self):
+        """
+        Test the creation of a coefficient bank for low shelf filters.
+        """
+        cutoffs = np.array([100.0, 1000.0, 10000.0])
+        bank = CoefficientBank.from_low_shelf(cutoffs, 44100, 0.707, 6.0)
+        self.assertEqual(len(bank), 3)
+        self.assertEqual(bank.b0.shape, (3,))
+
+    def test_from_peaking_eq(self):
+        """
+        Test the creation of a coefficient bank for peaking EQ filters.
+        """
+        cutoffs = np.array([100.0, 1000.0, 10000.0])
+        bank = CoefficientBank.from_peaking_eq(cutoffs, 44100, 0.707, 6.0)
+        self.assertEqual(len(bank), 3)
+        self.assertEqual(bank.a2.shape, (3,))
+
+    def test_astype_float32(self):
+        """
+        Test the conversion of a coefficient bank to single precision.
+        """
+        cutoffs = np.array([100.0, 1000.0])
+        bank = CoefficientBank.from_low_shelf(cutoffs, 44100, 0.707, 6.0)
+        converted = bank.astype(np.float32)
+        self.assertEqual(converted.b0.dtype, np.float32)
+        np.testing.assert_allclose(converted.b0, bank.b0, rtol=1e-6)
+
+    def test_to_coefficients_list(self):
+        """
+        Test the conversion of a coefficient bank to a list of Coefficients.
+        """
+        cutoffs = np.array([100.0, 1000.0])
+        bank = CoefficientBank.from_peaking_eq(cutoffs, 44100, 0.707, 6.0)
+        coefficients = bank.to_coefficients_list()
+        self.assertEqual(len(coefficients), 2)
+        for i, c in enumerate(coefficients):
+            self.assertAlmostEqual(c.b0, bank.b0[i])
+            self.assertAlmostEqual(c.a2, bank.a2[i])
+            dbf = DigitalBiquadFilter.create(c)
+            self.assertIsNotNone(dbf)
+
+
 if __name__ == "__main__":
     unittest.main()
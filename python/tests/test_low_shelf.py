@@ -25,6 +25,8 @@ SOFTWARE.
 import unittest
 import math
 
+import numpy as np
+
 from src.biquads import LowShelfFilter
 
 
@@ -91,6 +93,35 @@ class TestLowShelfFilter(unittest.TestCase):
         lsf.set_q_factor(1.0)
         self.assertAlmostEqual(lsf.get_q_factor(), 1.0)
 
+    def test_repeated_construction_is_independent(self):
+        """
+        Test that filters built from identical parameters do not share
+        coefficient state.
+        """
+        first = LowShelfFilter.create(1000.0, 44100, gain=6.0)
+        second = LowShelfFilter.create(1000.0, 44100, gain=6.0)
+        self.assertIsNotNone(first)
+        self.assertIsNotNone(second)
+        self.assertIsNot(first.m_filter.coefficients, second.m_filter.coefficients)
+        self.assertEqual(first.m_filter.coefficients, second.m_filter.coefficients)
+
+    def test_calculate_coefficients_batch(self):
+        """
+        Test the calculate_coefficients_batch method against the scalar path.
+        """
+        cutoffs = np.array([100.0, 1000.0, 10000.0])
+        gains = np.array([-6.0, 0.0, 6.0])
+        batch = LowShelfFilter.calculate_coefficients_batch(cutoffs, 44100, 1.0 / math.sqrt(2.0), gains)
+        self.assertEqual(batch.shape, (3, 6))
+        for i in range(len(cutoffs)):
+            lsf = LowShelfFilter.create(cutoffs[i], 44100, gain=gains[i])
+            self.assertIsNotNone(lsf)
+            c = lsf.calculate_coefficients()
+            # The scalar path interpolates sin/cos from a table, so allow
+            # its small absolute error against the exact batch math.
+            np.testing.assert_allclose(batch[i], [c.b0, c.b1, c.b2, c.a0, c.a1, c.a2],
+                                       atol=1e-7)
+
 
 if __name__ == "__main__":
     unittest.main()
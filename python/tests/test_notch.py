@@ -28,9 +28,9 @@ import math
 from src.biquads import NotchFilter
 
 
-class TestNotchFilter(unittest.TestCase):
+class TestNotchFilterCreate(unittest.TestCase):
     """
-    Test the NotchFilter class.
+    Test the creation of NotchFilter objects.
     """
 
     def test_create_valid_double_filter(self):
@@ -61,35 +61,43 @@ class TestNotchFilter(unittest.TestCase):
         notch = NotchFilter.create(1000.0, 0)
         self.assertIsNone(notch)
 
+
+class TestNotchFilterMutators(unittest.TestCase):
+    """
+    Test the setter methods of the NotchFilter class, sharing one freshly
+    built filter per test instead of re-creating it inline.
+    """
+
+    def setUp(self):
+        """
+        Build the filter each mutator test starts from.
+        """
+        self.notch = NotchFilter.create(1000.0, 44100)
+        self.assertIsNotNone(self.notch)
+
     def test_set_cutoff_frequency(self):
         """
         Test the set_cutoff method.
         """
-        notch = NotchFilter.create(1000.0, 44100)
-        self.assertIsNotNone(notch)
-        self.assertAlmostEqual(notch.get_cutoff(), 1000.0)
-        notch.set_cutoff(2000.0)
-        self.assertAlmostEqual(notch.get_cutoff(), 2000.0)
+        self.assertAlmostEqual(self.notch.get_cutoff(), 1000.0)
+        self.notch.set_cutoff(2000.0)
+        self.assertAlmostEqual(self.notch.get_cutoff(), 2000.0)
 
     def test_set_sample_rate(self):
         """
         Test the set_sample_rate method.
         """
-        notch = NotchFilter.create(1000.0, 44100)
-        self.assertIsNotNone(notch)
-        self.assertEqual(notch.get_sample_rate(), 44100)
-        notch.set_sample_rate(48000)
-        self.assertEqual(notch.get_sample_rate(), 48000)
+        self.assertEqual(self.notch.get_sample_rate(), 44100)
+        self.notch.set_sample_rate(48000)
+        self.assertEqual(self.notch.get_sample_rate(), 48000)
 
     def test_set_quality_factor(self):
         """
         Test the set_q_factor method.
         """
-        notch = NotchFilter.create(1000.0, 44100)
-        self.assertIsNotNone(notch)
-        self.assertAlmostEqual(notch.get_q_factor(), 1 / math.sqrt(2))
-        notch.set_q_factor(1.0)
-        self.assertAlmostEqual(notch.get_q_factor(), 1.0)
+        self.assertAlmostEqual(self.notch.get_q_factor(), 1 / math.sqrt(2))
+        self.notch.set_q_factor(1.0)
+        self.assertAlmostEqual(self.notch.get_q_factor(), 1.0)
 
 
 if __name__ == "__main__":
@@ -25,6 +25,8 @@ SOFTWARE.
 import unittest
 import math
 
+import numpy as np
+
 from src.biquads import PeakingEQFilter
 
 
@@ -91,6 +93,37 @@ class TestPeakingEQFilter(unittest.TestCase):
         peqf.set_q_factor(1.0)
         self.assertAlmostEqual(peqf.get_q_factor(), 1.0)
 
+    def test_zero_gain_passthrough(self):
+        """
+        Test that a peaking EQ with the default zero gain passes samples
+        through unchanged.
+        """
+        peqf = PeakingEQFilter.create(1000.0, 44100)
+        self.assertIsNotNone(peqf)
+        c = peqf.calculate_coefficients()
+        self.assertAlmostEqual(c.b0, c.a0)
+        self.assertAlmostEqual(c.b1, c.a1)
+        self.assertAlmostEqual(c.b2, c.a2)
+        for sample in (0.5, -0.25, 1.0):
+            self.assertAlmostEqual(peqf.process(sample), sample)
+
+    def test_calculate_coefficients_batch(self):
+        """
+        Test the calculate_coefficients_batch method against the scalar path.
+        """
+        cutoffs = np.array([100.0, 1000.0, 10000.0])
+        gains = np.array([-6.0, 0.0, 6.0])
+        batch = PeakingEQFilter.calculate_coefficients_batch(cutoffs, 44100, 1.0 / math.sqrt(2.0), gains)
+        self.assertEqual(batch.shape, (3, 6))
+        for i in range(len(cutoffs)):
+            peqf = PeakingEQFilter.create(cutoffs[i], 44100, gain=gains[i])
+            self.assertIsNotNone(peqf)
+            c = peqf.calculate_coefficients()
+            # The scalar path interpolates sin/cos from a table, so allow
+            # its small absolute error against the exact batch math.
+            np.testing.assert_allclose(batch[i], [c.b0, c.b1, c.b2, c.a0, c.a1, c.a2],
+                                       atol=1e-7)
+
 
 if __name__ == "__main__":
     unittest.main()